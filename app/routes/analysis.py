@@ -1,12 +1,11 @@
 from fastapi import APIRouter, Request, Form
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from app.models.resume_schema import Resume, JobDescription, AnalysisResult
 from app.services.skill_matcher import analyze_resume_vs_jd
+from app.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
 
 @router.post("/analysis", response_class=HTMLResponse)
 async def analyze(request: Request,
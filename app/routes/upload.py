@@ -1,15 +1,41 @@
-from fastapi import APIRouter, Request, UploadFile, File, Form
+import asyncio
+import logging
+
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Form
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from app.services.resume_parser import read_resume_text
-from app.services.extractor import extract_resume_info
+from app.services.extractor import extract_resume_info, save_extracted_data, debug_dump_enabled, label_url
 from app.services.groq_analyzer import generate_resume_analysis
-from app.models.resume_schema import Resume, JobDescription
+from app.models.resume_schema import OnlineProfile, Resume, JobDescription
+from app.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+
+logger = logging.getLogger(__name__)
+
+# Reject anything bigger than this before parsing starts
+MAX_RESUME_BYTES = 20 * 1024 * 1024
+
+# How many resumes a batch upload may parse/analyze at once
+BATCH_CONCURRENCY = 8
+
+
+def merge_hyperlinks(resume_obj: Resume, hyperlinks: List[Tuple[str, str]]) -> None:
+    """Merge parser-found hyperlinks into the resume's profiles, deduped by URL."""
+    existing_urls = {p.url for p in resume_obj.online_profiles}
+    for link_text, url in hyperlinks:
+        if url and url not in existing_urls:
+            existing_urls.add(url)
+            resume_obj.online_profiles.append(OnlineProfile(label=label_url(url), url=url))
+
+
+def _log_dump_failure(future: asyncio.Future) -> None:
+    """Retrieve the debug-dump result so a failure is logged, not lost."""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Debug dump failed: %s", exc)
 
 @router.get("/", response_class=HTMLResponse)
 async def get_upload_page(request: Request):
@@ -21,18 +47,21 @@ async def upload_resume(request: Request,
                         jd_title: Optional[str] = Form(None),
                         jd_text: Optional[str] = Form(None)):
     """Upload and analyze resume against JD."""
+    if resume.size is not None and resume.size > MAX_RESUME_BYTES:
+        raise HTTPException(status_code=413, detail="Resume file too large (20 MB limit).")
+
     # Parse resume (now returns text + hyperlinks)
     text, hyperlinks = await read_resume_text(resume)
     resume_obj: Resume = extract_resume_info(text)
-    
+
+    # Debug dump is opt-in and written off the event loop
+    if debug_dump_enabled():
+        dump = asyncio.get_running_loop().run_in_executor(None, save_extracted_data, text, resume_obj)
+        dump.add_done_callback(_log_dump_failure)
+
     # If hyperlinks were found, merge them with extracted profiles
     if hyperlinks:
-        from app.models.resume_schema import OnlineProfile
-        from app.services.extractor import label_url
-        for link_text, url in hyperlinks:
-            if url and not any(p.url == url for p in resume_obj.online_profiles):
-                profile = OnlineProfile(label=label_url(url), url=url)
-                resume_obj.online_profiles.append(profile)
+        merge_hyperlinks(resume_obj, hyperlinks)
 
     # Prepare JD
     jd_desc = jd_text or ""
@@ -44,7 +73,7 @@ async def upload_resume(request: Request,
     groq_error = None
     if jd_desc:
         try:
-            analysis_data = generate_resume_analysis(resume_obj, jd_obj)
+            analysis_data = await generate_resume_analysis(resume_obj, jd_obj)
             analysis = analysis_data
         except Exception as e:
             groq_error = f"Analysis Error: {str(e)}. Please ensure GROQ_API_KEY2 is set in .env file."
@@ -56,3 +85,38 @@ async def upload_resume(request: Request,
         "analysis": analysis,
         "groq_error": groq_error
     })
+
+
+@router.post("/upload_batch")
+async def upload_resume_batch(resumes: List[UploadFile] = File(...),
+                              jd_title: Optional[str] = Form(None),
+                              jd_text: Optional[str] = Form(None)):
+    """
+    Analyze many resumes against one JD in a single request.
+    Resumes are processed concurrently (bounded by BATCH_CONCURRENCY) and
+    share the pooled Groq client and analysis cache; returns a JSON array
+    instead of rendering a template per resume.
+    """
+    jd_obj = JobDescription(title=jd_title or "", description=jd_text or "")
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def process_one(file: UploadFile) -> dict:
+        async with semaphore:
+            if file.size is not None and file.size > MAX_RESUME_BYTES:
+                return {"filename": file.filename, "error": "Resume file too large (20 MB limit)."}
+            try:
+                text, hyperlinks = await read_resume_text(file)
+                resume_obj = extract_resume_info(text)
+                if hyperlinks:
+                    merge_hyperlinks(resume_obj, hyperlinks)
+
+                analysis = None
+                if jd_obj.description:
+                    analysis = await generate_resume_analysis(resume_obj, jd_obj)
+
+                return {"filename": file.filename, "resume": resume_obj.model_dump(), "analysis": analysis}
+            except Exception as e:
+                return {"filename": file.filename, "error": str(e)}
+
+    results = await asyncio.gather(*(process_one(f) for f in resumes))
+    return {"jd": jd_obj.model_dump(), "results": list(results)}
@@ -1,14 +1,24 @@
 """Enhanced extraction of fields from resume text using regex and heuristics."""
+import json
 import re
 import os
+import time
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
+import ahocorasick
 from app.models.resume_schema import Resume, OnlineProfile, Project
 from app.utils.text_cleaner import normalize_text
 
-EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
-PHONE_RE = re.compile(r"(?:\+\d{1,3}[\s.-]?)?(?:\d{2,4}[\s.-]?)?\d{3}[\s.-]?\d{3,4}[\s.-]?\d{3,4}|\+\d{1,3}\s?\d{6,14}")
-URL_RE = re.compile(r"https?://[^\s]+")
+# Contact patterns only ever match ASCII; re.ASCII keeps \d/\s/\b on the
+# fast byte-class path instead of consulting Unicode property tables.
+EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", re.ASCII)
+PHONE_RE = re.compile(r"(?:\+\d{1,3}[\s.-]?)?(?:\d{2,4}[\s.-]?)?\d{3}[\s.-]?\d{3,4}[\s.-]?\d{3,4}|\+\d{1,3}\s?\d{6,14}", re.ASCII)
+URL_RE = re.compile(r"https?://[^\s]+", re.ASCII)
+PROFILE_MENTION_RE = re.compile(
+    r'\b(LinkedIn|GitHub|Kaggle|LeetCode|Codeforces|Portfolio|Medium|GitLab)\b',
+    re.IGNORECASE | re.ASCII,
+)
 
 # Expanded profile labels for better matching
 PROFILE_LABELS = {
@@ -69,26 +79,122 @@ SECTION_KEYWORDS = {
     "achievements": ["achievements", "awards", "recognitions", "publications", "certifications", "honors", "accomplishments"],
 }
 
+def build_keyword_automaton(words) -> ahocorasick.Automaton:
+    """Compile a word list into a single Aho-Corasick automaton (built once at import)."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word.lower(), word)
+    automaton.make_automaton()
+    return automaton
+
+
+TECH_AUTOMATON = build_keyword_automaton(TECH_WORDS)
+
+# "Common" techs used as a cheap project-line hint (first 10 entries of TECH_WORDS)
+_COMMON_TECH_WORDS = frozenset(TECH_WORDS[:10])
+
+
+def scan_keywords(automaton: ahocorasick.Automaton, text_lower: str) -> set:
+    """
+    Single linear automaton pass over lowercased text.
+    Hits are kept only when flanked by non-word characters, mirroring a
+    per-keyword \\b regex.
+    """
+    found = set()
+    n = len(text_lower)
+    for end, word in automaton.iter(text_lower):
+        start = end - len(word) + 1
+        if start > 0:
+            prev = text_lower[start - 1]
+            if prev.isalnum() or prev == "_":
+                continue
+        if end + 1 < n:
+            nxt = text_lower[end + 1]
+            if nxt.isalnum() or nxt == "_":
+                continue
+        found.add(word)
+    return found
+
+
+def _find_tech_words(text_lower: str) -> set:
+    """Scan for TECH_WORDS hits with the shared automaton."""
+    return scan_keywords(TECH_AUTOMATON, text_lower)
+
+
 PROJECT_HINTS = ["project", "assignment", "case study", "capstone", "experience"]
 EXPERIENCE_HINTS = ["experience", "worked", "developed", "led", "managed", "implemented", "built", "designed", "created", "achieved"]
 
 
+@dataclass
+class ParsedText:
+    """
+    Resume text pre-processed once and shared by all extractors.
+
+    Holds the raw text, a single lowercased copy, the line split (raw and
+    lowercased) and section boundaries as (start, end) line indices, so no
+    extractor has to re-split or re-lower the full text.
+    """
+    text: str
+    text_lower: str
+    lines: List[str]
+    lines_lower: List[str]
+    sections: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    def section_text(self, name: str) -> str:
+        """Materialize a section's content from its line span (empty if absent)."""
+        span = self.sections.get(name)
+        if not span:
+            return ""
+        start, end = span
+        return "\n".join(self.lines[start:end]).strip()
+
+    def section_span(self, name: str) -> Tuple[int, int]:
+        """Line span for a section, falling back to the whole document."""
+        return self.sections.get(name) or (0, len(self.lines))
+
+
+def parse_text(text: str) -> ParsedText:
+    """
+    Split and lowercase the resume text once, detecting section boundaries
+    in the same traversal.
+    """
+    lines = text.split('\n')
+    lines_lower = [line.lower() for line in lines]
+    parsed = ParsedText(text=text, text_lower=text.lower(), lines=lines, lines_lower=lines_lower)
+
+    current_section = "contact"  # Usually contact info is at top
+    current_start = 0
+
+    for i, line in enumerate(lines):
+        detected_section = _classify_header(line, lines_lower[i])
+
+        if detected_section:
+            # Close previous section; the header line starts the new one
+            parsed.sections[current_section] = (current_start, i)
+            current_section = detected_section
+            current_start = i
+
+    parsed.sections[current_section] = (current_start, len(lines))
+    return parsed
+
+
+# One alternation over all profile keys; lastgroup maps back to the label
+_LABEL_RE = re.compile("|".join(f"(?P<{key}>{key})" for key in PROFILE_LABELS), re.IGNORECASE)
+
+
 def label_url(url: str) -> str:
     """Classify URL to appropriate profile type."""
-    u = url.lower()
-    for key, lbl in PROFILE_LABELS.items():
-        if key in u:
-            return lbl
-    return "Website"
+    match = _LABEL_RE.search(url)
+    return PROFILE_LABELS[match.lastgroup] if match else "Website"
 
 
-def extract_name_robust(text: str) -> str:
+def extract_name_robust(parsed: ParsedText) -> str:
     """
     Extract full name from resume text.
     Handles multi-line names and formatting issues.
     Returns clean, single-line format.
     """
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    lines = [l.strip() for l in parsed.lines if l.strip()]
     if not lines:
         return ""
     
@@ -145,54 +251,31 @@ def extract_phone(text: str) -> str:
     return match.group(0) if match else ""
 
 
-def detect_section_start(line: str, section: str) -> bool:
-    """Detect if line is a section header."""
-    line_lower = line.lower().strip()
-    if ':' not in line and not line_lower.endswith('s'):
-        return False
-    keywords = SECTION_KEYWORDS.get(section, [])
-    return any(kw in line_lower for kw in keywords)
+# One compiled keyword alternation per section, kept in priority order
+_SECTION_HEADER_RES = [
+    (name, re.compile("|".join(re.escape(kw) for kw in keywords)))
+    for name, keywords in SECTION_KEYWORDS.items()
+]
 
 
-def split_resume_by_sections(text: str) -> Dict[str, str]:
-    """
-    Split resume text into semantic sections.
-    Returns dict with section names as keys and content as values.
-    """
-    sections = {k: "" for k in SECTION_KEYWORDS.keys()}
-    sections["other"] = ""
-    
-    lines = text.split('\n')
-    current_section = "contact"  # Usually contact info is at top
-    current_content = []
-    
-    for line in lines:
-        line_lower = line.lower().strip()
-        
-        # Check if this line starts a new section
-        detected_section = None
-        for section_name in SECTION_KEYWORDS.keys():
-            if detect_section_start(line, section_name):
-                detected_section = section_name
-                break
-        
-        if detected_section:
-            # Save previous section
-            sections[current_section] = '\n'.join(current_content).strip()
-            current_section = detected_section
-            current_content = [line]  # Start with the header line
-        else:
-            current_content.append(line)
-    
-    # Save last section
-    sections[current_section] = '\n'.join(current_content).strip()
-    
-    return sections
+def _classify_header(line: str, line_lower: str) -> Optional[str]:
+    """Return the section this line starts, or None if it isn't a header."""
+    stripped = line_lower.strip()
+    if ':' not in line and not stripped.endswith('s'):
+        return None
+    for name, pattern in _SECTION_HEADER_RES:
+        if pattern.search(stripped):
+            return name
+    return None
+
+
+_PROJECT_MARKER_RE = re.compile(r"project:", re.IGNORECASE)
 
 
-def extract_projects_from_text(text: str) -> List[Project]:
+def extract_projects_from_text(parsed: ParsedText) -> List[Project]:
     """
-    Extract projects with technologies from text.
+    Extract projects with technologies from the projects section (or the
+    whole document when no projects section was detected).
     Looks for project entries typically formatted as:
     Project Name (Tech Stack) - Description
     or
@@ -200,60 +283,58 @@ def extract_projects_from_text(text: str) -> List[Project]:
     Technologies: Python, SQL, etc
     """
     projects: List[Project] = []
-    
-    lines = text.split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
+
+    start, end = parsed.section_span("projects")
+    for line, line_lower in zip(parsed.lines[start:end], parsed.lines_lower[start:end]):
+        line = line.strip()
+        line_lower = line_lower.strip()
+
+        # Single automaton scan per line instead of ~150 substring checks
+        hits = _find_tech_words(line_lower)
+
         # Look for project indicators
-        if any(hint in line.lower() for hint in ["project:", "• "]) or (
-            line and not line[0].isdigit() and len(line) > 5 and 
-            any(tech.lower() in line.lower() for tech in TECH_WORDS[:10])  # Common techs
+        if any(hint in line_lower for hint in ["project:", "• "]) or (
+            line and not line[0].isdigit() and len(line) > 5 and
+            hits & _COMMON_TECH_WORDS  # Common techs
         ):
             # Extract tech from this line
-            techs = [t for t in TECH_WORDS if t.lower() in line.lower()]
-            
-            # Get project name (remove tech keywords)
+            techs = sorted(hits)
+
+            # Get project name: strip matched techs with one case-insensitive
+            # sub (the old per-tech replace re-lowered the name every pass)
             project_name = line
-            for tech in techs:
-                project_name = project_name.lower().replace(tech.lower(), "").strip()
-            project_name = project_name.replace("•", "").replace("project:", "").strip()
+            if techs:
+                tech_re = re.compile(
+                    "|".join(re.escape(t) for t in sorted(techs, key=len, reverse=True)),
+                    re.IGNORECASE,
+                )
+                project_name = tech_re.sub("", project_name)
+            project_name = _PROJECT_MARKER_RE.sub("", project_name).replace("•", "").strip()
             project_name = project_name.split("(")[0].strip()  # Remove parenthetical tech
-            
+
             if project_name and len(project_name) > 3:
                 projects.append(Project(
                     name=project_name[:150],
                     technologies=sorted(set(techs))[:10]  # Top 10 techs per project
                 ))
-        
-        i += 1
-    
+
     return projects[:10]  # Max 10 projects
 
 
-def extract_skills_from_text(text: str) -> List[str]:
-    """Extract all detected technical skills from resume."""
-    text_lower = text.lower()
-    detected_skills = set()
-    
-    # Find exact matches for tech words
-    for tech in TECH_WORDS:
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(tech) + r'\b'
-        if re.search(pattern, text_lower):
-            detected_skills.add(tech)
-    
-    return sorted(list(detected_skills))
+def extract_skills_from_text(parsed: ParsedText) -> List[str]:
+    """Extract all detected technical skills from resume in one automaton pass."""
+    return sorted(_find_tech_words(parsed.text_lower))
 
 
-def extract_achievements_from_text(text: str) -> List[str]:
-    """Extract achievements and accomplishments from text."""
+def extract_achievements_from_text(parsed: ParsedText) -> List[str]:
+    """Extract achievements from the achievements section (or whole document)."""
     achievements = []
-    lines = text.split('\n')
-    
-    for line in lines:
+    start, end = parsed.section_span("achievements")
+
+    for line in parsed.lines[start:end]:
         line = line.strip()
+        if not line:
+            continue
         # Look for bullet points or numbered items
         if line.startswith('•') or line.startswith('-') or line[0].isdigit() and '.' in line[:3]:
             achievement = line.lstrip('•-0123456789. ').strip()
@@ -263,162 +344,74 @@ def extract_achievements_from_text(text: str) -> List[str]:
     return achievements[:10]  # Max 10 achievements
 
 
-def extract_profiles_from_text(text: str) -> List[OnlineProfile]:
+def extract_profiles_from_text(parsed: ParsedText) -> List[OnlineProfile]:
     """Extract online profiles/links from text."""
     profiles = []
-    urls = URL_RE.findall(text)
-    
+    urls = URL_RE.findall(parsed.text)
+
     # Also look for plain profile names mentioned in text
-    profile_mentions = re.findall(
-        r'\b(LinkedIn|GitHub|Kaggle|LeetCode|Codeforces|Portfolio|Medium|GitLab)\b',
-        text,
-        re.IGNORECASE
-    )
+    profile_mentions = PROFILE_MENTION_RE.findall(parsed.text)
     
-    # Match URLs to mentioned profiles
+    # Match URLs to mentioned profiles (first occurrence wins; dedupe by URL)
+    seen_urls = set()
     for url in urls:
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
         label = label_url(url)
         profiles.append(OnlineProfile(label=label, url=url))
-    
+
     return profiles
 
 
 
 
-def classify_resume_sections(text: str) -> dict:
+def classify_resume_sections(parsed: ParsedText) -> dict:
     """
     Classify and extract content from each resume section.
     Returns comprehensive section breakdown with proper categorization.
     """
-    sections = split_resume_by_sections(text)
-    
     return {
-        "full_text": text,
-        "contact": sections.get("contact", "").strip(),
-        "summary": sections.get("summary", "").strip(),
-        "education": sections.get("education", "").strip(),
-        "experience": sections.get("experience", "").strip(),
-        "projects": sections.get("projects", "").strip(),
-        "skills": sections.get("skills", "").strip(),
-        "achievements": sections.get("achievements", "").strip(),
+        "full_text": parsed.text,
+        "contact": parsed.section_text("contact"),
+        "summary": parsed.section_text("summary"),
+        "education": parsed.section_text("education"),
+        "experience": parsed.section_text("experience"),
+        "projects": parsed.section_text("projects"),
+        "skills": parsed.section_text("skills"),
+        "achievements": parsed.section_text("achievements"),
     }
 
 
+def debug_dump_enabled() -> bool:
+    """Debug extraction reports are opt-in via the RESUME_DEBUG_DUMP env flag."""
+    return os.getenv("RESUME_DEBUG_DUMP") == "1"
+
+
 def save_extracted_data(text: str, extracted: Resume) -> None:
     """
-    Save FULL extracted data with proper classification to debug text file.
-    Now properly extracts and classifies education, projects, skills, and achievements.
+    Append one JSON line with the full extraction (raw sections + parsed
+    model output) to the rolling debug dump at results/extracted.jsonl.
+    Runs off the request path (see the upload route), so it re-parses the
+    text itself rather than borrowing the request's ParsedText.
     """
     result_dir = "results"
     os.makedirs(result_dir, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{result_dir}/extracted_{timestamp}.txt"
-    
-    # Classify sections
-    sections = classify_resume_sections(text)
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        # Header
-        f.write("=" * 100 + "\n")
-        f.write(f"RESUME EXTRACTION & CLASSIFICATION REPORT - {datetime.now().isoformat()}\n")
-        f.write("=" * 100 + "\n\n")
-        
-        # Full Raw Text
-        f.write("📄 FULL RAW TEXT (Complete Extracted Content):\n")
-        f.write("-" * 100 + "\n")
-        f.write(text)
-        f.write("\n\n")
-        
-        # Classified Sections (RAW SECTION CONTENT)
-        f.write("=" * 100 + "\n")
-        f.write("🔍 CLASSIFIED SECTIONS (Raw Section Content):\n")
-        f.write("=" * 100 + "\n\n")
-        
-        if sections["contact"].strip():
-            f.write("📞 CONTACT INFORMATION:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["contact"].strip() + "\n\n")
-        
-        if sections["summary"].strip():
-            f.write("📋 SUMMARY / OBJECTIVE:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["summary"].strip() + "\n\n")
-        
-        if sections["education"].strip():
-            f.write("🎓 EDUCATION:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["education"].strip() + "\n\n")
-        
-        if sections["experience"].strip():
-            f.write("💼 EXPERIENCE / WORK:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["experience"].strip() + "\n\n")
-        
-        if sections["projects"].strip():
-            f.write("🚀 PROJECTS / PORTFOLIO:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["projects"].strip() + "\n\n")
-        
-        if sections["skills"].strip():
-            f.write("🛠️ SKILLS / TECHNOLOGIES:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["skills"].strip() + "\n\n")
-        
-        if sections["achievements"].strip():
-            f.write("🏆 ACHIEVEMENTS / CERTIFICATIONS:\n")
-            f.write("-" * 100 + "\n")
-            f.write(sections["achievements"].strip() + "\n\n")
-        
-        # Structured Extraction (PARSED MODEL OUTPUT)
-        f.write("=" * 100 + "\n")
-        f.write("✅ STRUCTURED EXTRACTION (Parsed Model Output):\n")
-        f.write("=" * 100 + "\n\n")
-        
-        f.write(f"👤 NAME: {extracted.name or 'NOT EXTRACTED'}\n")
-        f.write(f"📧 EMAIL: {extracted.email or 'NOT EXTRACTED'}\n")
-        f.write(f"📱 PHONE: {extracted.phone or 'NOT EXTRACTED'}\n\n")
-        
-        f.write(f"📝 EXPERIENCE SUMMARY:\n{extracted.experience_summary or 'NOT EXTRACTED'}\n\n")
-        
-        f.write(f"🛠️ SKILLS ({len(extracted.skills)} detected):\n")
-        if extracted.skills:
-            for skill in sorted(extracted.skills):
-                f.write(f"  ✓ {skill}\n")
-        else:
-            f.write("  (No skills extracted)\n")
-        f.write("\n")
-        
-        f.write(f"🌐 ONLINE PROFILES ({len(extracted.online_profiles)} found):\n")
-        if extracted.online_profiles:
-            for p in extracted.online_profiles:
-                f.write(f"  • {p.label}: {p.url}\n")
-        else:
-            f.write("  (No profiles found)\n")
-        f.write("\n")
-        
-        f.write(f"🚀 PROJECTS ({len(extracted.projects)} detected):\n")
-        if extracted.projects:
-            for i, proj in enumerate(extracted.projects, 1):
-                f.write(f"  {i}. {proj.name}\n")
-                if proj.technologies:
-                    f.write(f"     Technologies: {', '.join(proj.technologies)}\n")
-        else:
-            f.write("  (No projects extracted)\n")
-        f.write("\n")
-        
-        f.write(f"🏆 ACHIEVEMENTS ({len(extracted.achievements or []) if extracted.achievements else 0} detected):\n")
-        if extracted.achievements:
-            for achievement in extracted.achievements:
-                f.write(f"  • {achievement}\n")
-        else:
-            f.write("  (No achievements extracted)\n")
-        f.write("\n")
-        
-        f.write("=" * 100 + "\n")
-        f.write("END OF REPORT\n")
-        f.write("=" * 100 + "\n")
 
+    # time_ns + pid uniquely identifies a record across workers; the old
+    # per-file naming had 1-second resolution and lost concurrent dumps
+    now_ns = time.time_ns()
+    parsed = parse_text(text)
+    record = {
+        "id": f"{now_ns}_{os.getpid()}",
+        "timestamp": datetime.fromtimestamp(now_ns / 1e9).isoformat(),
+        "sections": classify_resume_sections(parsed),
+        "extracted": extracted.model_dump(),
+    }
+
+    # One serialization + one write, appended to a single rolling file
+    with open(os.path.join(result_dir, "extracted.jsonl"), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=True) + "\n")
 
 
 def extract_resume_info(text: str) -> Resume:
@@ -426,27 +419,27 @@ def extract_resume_info(text: str) -> Resume:
     Enhanced extraction using robust heuristics and proper section detection.
     Now correctly extracts: name, contact info, skills, projects, achievements, and profiles.
     """
+    # Split, lowercase and section the text exactly once
+    parsed = parse_text(text)
+
     # Extract basic contact information
-    name = extract_name_robust(text)
+    name = extract_name_robust(parsed)
     email = extract_email(text)
     phone = extract_phone(text)
-    
-    # Extract sections
-    sections = split_resume_by_sections(text)
-    
+
     # Extract summary from summary section
-    experience_summary = sections.get("summary", "").strip()
+    experience_summary = parsed.section_text("summary")
     if not experience_summary:
         # Fallback: try to get first paragraph
-        lines = [l.strip() for l in text.split('\n') if l.strip() and len(l.strip()) > 20]
+        lines = [l.strip() for l in parsed.lines if l.strip() and len(l.strip()) > 20]
         if len(lines) > 2:
             experience_summary = lines[1][:300]
-    
+
     # Extract structured data from their respective sections
-    profiles = extract_profiles_from_text(text)
-    skills = extract_skills_from_text(text)
-    projects = extract_projects_from_text(sections.get("projects", text))
-    achievements = extract_achievements_from_text(sections.get("achievements", text))
+    profiles = extract_profiles_from_text(parsed)
+    skills = extract_skills_from_text(parsed)
+    projects = extract_projects_from_text(parsed)
+    achievements = extract_achievements_from_text(parsed)
     
     resume_obj = Resume(
         name=name or "NOT EXTRACTED",
@@ -458,8 +451,5 @@ def extract_resume_info(text: str) -> Resume:
         skills=skills,
         achievements=achievements if achievements else None,
     )
-    
-    # Save debug file
-    save_extracted_data(text, resume_obj)
-    
+
     return resume_obj
@@ -1,49 +1,55 @@
 """Groq API integration for AI-powered resume analysis."""
+import hashlib
 import os
-from groq import Groq
+import re
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from groq import AsyncGroq
 from app.models.resume_schema import Resume, JobDescription
 
-def get_groq_client() -> Groq:
-    """Initialize Groq client with API key from environment."""
-    api_key = os.getenv("GROQ_API_KEY2")
-    if not api_key:
-        raise ValueError("GROQ_API_KEY2 environment variable not set. Please add it to your .env file.")
-    return Groq(api_key=api_key)
+# LRU cache of completed analyses keyed by (resume digest, JD digest).
+# The Groq round-trip is seconds; a hit for a repeated resume+JD pair is free.
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+_ANALYSIS_CACHE_MAX = 512
 
 
-def generate_resume_analysis(resume: Resume, jd: JobDescription) -> dict:
-    """
-    Generate detailed compatibility analysis using Groq API.
-    
-    Args:
-        resume: Extracted resume data
-        jd: Job description
-    
-    Returns:
-        dict with analysis results
-    """
-    client = get_groq_client()
-    
-    # Prepare resume summary
-    resume_summary = f"""
-    Name: {resume.name}
-    Email: {resume.email}
-    Phone: {resume.phone}
-    Skills: {', '.join(resume.skills)}
-    Experience: {resume.experience_summary or 'Not specified'}
-    Projects: {', '.join([p.name for p in resume.projects]) if resume.projects else 'None mentioned'}
-    Online Profiles: {', '.join([f"{p.label}: {p.url}" for p in resume.online_profiles])}
-    """
-    
-    # Create prompt for Groq
-    prompt = f"""Analyze this resume against the job description and provide:
+def _digest(payload: str) -> str:
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
-RESUME:
-{resume_summary}
+
+def _analysis_cache_key(resume: Resume, jd: JobDescription) -> Tuple[str, str]:
+    """Content-addressed key: canonical resume JSON and the raw JD text."""
+    return (
+        _digest(resume.model_dump_json()),
+        _digest(jd.title + "\n" + jd.description),
+    )
+
+
+# Module singleton so the underlying httpx connection pool is reused
+# across requests instead of being rebuilt per call.
+_CLIENT: Optional[AsyncGroq] = None
+
+
+def get_groq_client() -> AsyncGroq:
+    """Return the shared AsyncGroq client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        api_key = os.getenv("GROQ_API_KEY2")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY2 environment variable not set. Please add it to your .env file.")
+        _CLIENT = AsyncGroq(api_key=api_key)
+    return _CLIENT
+
+
+# Prompt template built once at import. The fixed instructions and the JD
+# come before the per-resume block, so when one JD is screened against many
+# resumes the shared prefix stays stable for provider-side prompt caching.
+_PROMPT_TEMPLATE = """Analyze this resume against the job description and provide:
 
 JOB DESCRIPTION:
-Title: {jd.title}
-Description: {jd.description}
+Title: {jd_title}
+Description: {jd_description}
 
 Please provide your analysis in this EXACT format (use these exact section headers):
 
@@ -67,10 +73,54 @@ RECOMMENDATIONS:
 OVERALL_ASSESSMENT:
 (2-3 sentences summarizing fit for this role)
 
-Be concise but detailed. Focus on technical fit."""
+Be concise but detailed. Focus on technical fit.
+
+RESUME:
+{resume_block}"""
+
+
+def _build_resume_block(resume: Resume) -> str:
+    """Render the per-resume prompt section with a single join."""
+    parts = [
+        f"Name: {resume.name}",
+        f"Email: {resume.email}",
+        f"Phone: {resume.phone}",
+        "Skills: " + ", ".join(resume.skills),
+        f"Experience: {resume.experience_summary or 'Not specified'}",
+        "Projects: " + (", ".join(p.name for p in resume.projects) if resume.projects else "None mentioned"),
+        "Online Profiles: " + ", ".join(f"{p.label}: {p.url}" for p in resume.online_profiles),
+    ]
+    return "\n".join(parts)
+
+
+async def generate_resume_analysis(resume: Resume, jd: JobDescription) -> dict:
+    """
+    Generate detailed compatibility analysis using Groq API.
+    
+    Args:
+        resume: Extracted resume data
+        jd: Job description
+    
+    Returns:
+        dict with analysis results
+    """
+    cache_key = _analysis_cache_key(resume, jd)
+    cached = _ANALYSIS_CACHE.get(cache_key)
+    if cached is not None:
+        _ANALYSIS_CACHE.move_to_end(cache_key)
+        return cached
+
+    client = get_groq_client()
+
+    # Fill the precomputed template; only the blocks below vary per call
+    prompt = _PROMPT_TEMPLATE.format(
+        jd_title=jd.title,
+        jd_description=jd.description,
+        resume_block=_build_resume_block(resume),
+    )
 
-    # Call Groq API
-    message = client.chat.completions.create(
+    # Call Groq API without blocking the event loop
+    message = await client.chat.completions.create(
         model="llama-3.1-8b-instant",
         messages=[{"role": "user", "content": prompt}],
         temperature=0.7,
@@ -78,13 +128,50 @@ Be concise but detailed. Focus on technical fit."""
     )
     
     response_text = message.choices[0].message.content
-    
-    # Parse response
-    return parse_groq_response(response_text)
+
+    # Parse response and remember it for identical resume+JD pairs
+    result = parse_groq_response(response_text)
+    _ANALYSIS_CACHE[cache_key] = result
+    if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAX:
+        _ANALYSIS_CACHE.popitem(last=False)
+    return result
+
+
+# Known section headers (checked with startswith on the upper-cased line)
+# mapped to their result keys, in the order the prompt requests them.
+_RESPONSE_HEADERS = (
+    ("COMPATIBILITY_SCORE", "compatibility_score"),
+    ("MATCHED_SKILLS", "matched_skills"),
+    ("MISSING_SKILLS", "missing_skills"),
+    ("STRENGTHS", "strengths"),
+    ("GAPS", "gaps"),
+    ("RECOMMENDATIONS", "recommendations"),
+    ("OVERALL_ASSESSMENT", "overall_assessment"),
+)
+_SCORE_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)")
+
+# Markdown/bullet decoration stripped before the header prefix check, so
+# lines like "**MATCHED_SKILLS:**" or "### GAPS" still switch sections
+_HEADER_DECOR = "*#>•- \t"
+
+
+def _take_score(result: dict, line: str) -> bool:
+    """Copy a 0-10 score from the line into result; True if one was found."""
+    match = _SCORE_RE.search(line)
+    if match:
+        score = float(match.group(1))
+        if 0 <= score <= 10:
+            result["compatibility_score"] = score
+            return True
+    return False
 
 
 def parse_groq_response(response: str) -> dict:
-    """Parse Groq response into structured format."""
+    """
+    Parse Groq response into structured format.
+    Single line-oriented pass: a header line switches the current section,
+    every other line is appended to that section in place.
+    """
     result = {
         "compatibility_score": 5.0,
         "matched_skills": [],
@@ -95,92 +182,58 @@ def parse_groq_response(response: str) -> dict:
         "overall_assessment": "Analysis complete.",
         "raw_response": response,
     }
-    
-    # Parse sections
-    sections = response.split("\n\n")
-    current_section = None
-    
-    for section in sections:
-        section_lower = section.lower()
-        
-        if "compatibility_score" in section_lower:
-            try:
-                # Extract score number
-                for word in section.split():
-                    try:
-                        score = float(word)
-                        if 0 <= score <= 10:
-                            result["compatibility_score"] = score
-                            break
-                    except ValueError:
-                        continue
-            except:
-                pass
-        
-        elif "matched_skills" in section_lower:
-            skills = extract_list_items(section)
-            result["matched_skills"] = skills
-        
-        elif "missing_skills" in section_lower:
-            skills = extract_list_items(section)
-            result["missing_skills"] = skills
-        
-        elif "strengths" in section_lower:
-            items = extract_list_items(section)
-            result["strengths"] = items
-        
-        elif "gaps" in section_lower:
-            items = extract_list_items(section)
-            result["gaps"] = items
-        
-        elif "recommendations" in section_lower:
-            items = extract_list_items(section)
-            result["recommendations"] = items
-        
-        elif "overall_assessment" in section_lower:
-            text = extract_text_after_header(section)
-            if text:
-                result["overall_assessment"] = text
-    
-    return result
 
+    assessment_parts = []
+    current_key = None
+    score_found = False
 
-def extract_list_items(text: str) -> list:
-    """Extract list items from section text."""
-    items = []
-    lines = text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        # Skip headers and empty lines
-        if not line or ':' in line or '=' in line:
+    for raw_line in response.splitlines():
+        line = raw_line.strip()
+        if not line:
             continue
-        # Remove list markers
-        if line.startswith('-'):
-            line = line[1:].strip()
-        elif line.startswith('•'):
-            line = line[1:].strip()
-        elif line and line[0].isdigit() and '.' in line[:3]:
-            line = line.split('.', 1)[1].strip()
-        
-        if line:
-            items.append(line)
-    
-    return items
 
+        line_upper = line.upper().lstrip(_HEADER_DECOR)
+        header_key = None
+        for prefix, key in _RESPONSE_HEADERS:
+            if line_upper.startswith(prefix):
+                header_key = key
+                break
+
+        if header_key:
+            current_key = header_key
+            if header_key == "compatibility_score":
+                score_found = _take_score(result, line)
+            elif header_key == "overall_assessment" and ':' in line:
+                # Keep any text following the header on the same line
+                rest = line.split(':', 1)[1].lstrip(_HEADER_DECOR).strip()
+                if rest:
+                    assessment_parts.append(rest)
+            continue
 
-def extract_text_after_header(text: str) -> str:
-    """Extract text content after header."""
-    lines = text.split('\n')
-    content = []
-    skip_header = True
-    
-    for line in lines:
-        if skip_header:
-            if ':' in line or '=' in line:
-                skip_header = False
+        if current_key == "compatibility_score":
+            # The score may sit on its own line below the header
+            if not score_found:
+                score_found = _take_score(result, line)
             continue
-        if line.strip():
-            content.append(line.strip())
-    
-    return ' '.join(content)
+
+        if current_key is None:
+            continue
+
+        if current_key == "overall_assessment":
+            assessment_parts.append(line)
+            continue
+
+        # List sections: strip the leading '-', '•' or 'N.' marker inline
+        item = line
+        if item.startswith('-') or item.startswith('•'):
+            item = item[1:].strip()
+        elif item[0].isdigit() and '.' in item[:3]:
+            item = item.split('.', 1)[1].strip()
+
+        if item:
+            result[current_key].append(item)
+
+    if assessment_parts:
+        result["overall_assessment"] = ' '.join(assessment_parts)
+
+    return result
@@ -1,55 +1,100 @@
 """Resume parsing utilities for PDF and DOCX with enhanced hyperlink extraction."""
+import asyncio
+import io
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import UploadFile
 import pdfplumber
 from docx import Document
 from docx.oxml.ns import qn
 from typing import List, Tuple
-import tempfile
 
-async def extract_hyperlinks_from_docx(doc: Document) -> List[Tuple[str, str]]:
+# Compiled once at import; matched against every extracted page/text blob
+_URL_RE = re.compile(r'https?://[^\s]+')
+
+# Documents longer than this get their pages extracted in parallel
+_PARALLEL_PAGE_THRESHOLD = 4
+_MAX_PDF_WORKERS = min(8, os.cpu_count() or 1)
+
+# Pages with fewer chars than this are treated as scanned/image-only
+_MIN_PAGE_CHARS = 20
+
+
+def _page_text(page) -> str:
+    """Page text, skipping layout work on scanned/image-only pages."""
+    if len(page.chars) < _MIN_PAGE_CHARS:
+        return ""
+    return page.extract_text() or ""
+
+
+def _extract_pages_chunk(content: bytes, start: int, end: int) -> List[str]:
+    """Extract a contiguous page range on this worker's own pdfplumber handle."""
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        return [_page_text(pdf.pages[i]) for i in range(start, end)]
+
+
+def _extract_pdf_text(stream) -> str:
+    """
+    Extract all page text from a PDF file object.
+    Short documents are read sequentially; longer ones are split into
+    contiguous page chunks extracted on a thread pool. pdfplumber handles
+    are not thread-safe, so each worker opens its own over the shared bytes.
+    """
+    with pdfplumber.open(stream) as pdf:
+        n_pages = len(pdf.pages)
+        if n_pages <= _PARALLEL_PAGE_THRESHOLD:
+            return "\n".join(_page_text(page) for page in pdf.pages) + "\n"
+
+    stream.seek(0)
+    content = stream.read()
+
+    workers = min(_MAX_PDF_WORKERS, n_pages)
+    step = -(-n_pages // workers)  # ceil division
+    bounds = [(i, min(i + step, n_pages)) for i in range(0, n_pages, step)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(lambda span: _extract_pages_chunk(content, *span), bounds)
+
+    # map preserves chunk order, so pages come back in document order
+    return "\n".join(part for chunk in chunks for part in chunk) + "\n"
+
+def extract_hyperlinks_from_docx(doc: Document) -> List[Tuple[str, str]]:
     """
     Extract hyperlinks from DOCX document.
+    One pass: map hyperlink relationship ids to URLs, then walk the lxml
+    body once collecting w:hyperlink anchors and their run text (covers
+    paragraphs and table cells alike).
     Returns list of (text, url) tuples.
     """
+    rid_to_url = {
+        rid: rel.target_ref
+        for rid, rel in doc.part.rels.items()
+        if "hyperlink" in rel.reltype
+    }
+    if not rid_to_url:
+        return []
+
     hyperlinks = []
-    
-    for rel in doc.part.rels.values():
-        # Look for hyperlink relationships
-        if "hyperlink" in rel.reltype:
-            url = rel.target_ref
-            # Try to find the link text in the document
-            for paragraph in doc.paragraphs:
-                if rel.rId in paragraph._element.xml:
-                    text = paragraph.text.strip()
-                    if text:
-                        hyperlinks.append((text, url))
-                        break
-            
-            # Also check in tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if rel.rId in cell._element.xml:
-                            text = cell.text.strip()
-                            if text:
-                                hyperlinks.append((text, url))
-                                break
-    
+    for node in doc.element.body.iter(qn('w:hyperlink')):
+        url = rid_to_url.get(node.get(qn('r:id')))
+        if not url:
+            continue
+        text = "".join(t.text or "" for t in node.iter(qn('w:t'))).strip()
+        if text:
+            hyperlinks.append((text, url))
+
     return hyperlinks
 
 
-async def extract_urls_from_text(text: str) -> List[Tuple[str, str]]:
+def extract_urls_from_text(text: str) -> List[Tuple[str, str]]:
     """
     Extract URLs from plain text.
     Returns list of (text, url) tuples.
     """
-    import re
-    
     urls = []
-    # Match common profile URLs in text
-    url_pattern = r'(https?://[^\s]+)|([A-Za-z]+\s+[A-Za-z]+\s+[A-Za-z]+\s+[A-Za-z]+)\s*(https?://[^\s]+)'
-    
-    matches = re.finditer(r'(https?://[^\s]+)', text)
+    matches = _URL_RE.finditer(text)
     for match in matches:
         url = match.group(0)
         urls.append(("Profile", url))
@@ -57,76 +102,79 @@ async def extract_urls_from_text(text: str) -> List[Tuple[str, str]]:
     return urls
 
 
+def _parse_pdf_sync(stream) -> Tuple[str, List[Tuple[str, str]]]:
+    """Blocking PDF parse: page text plus URLs found in it."""
+    text = _extract_pdf_text(stream)
+
+    # One URL scan over the joined text instead of one per page
+    return text, extract_urls_from_text(text)
+
+
+def _parse_docx_sync(stream) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Blocking DOCX parse: paragraph/table text plus hyperlinks.
+    One walk over the already-parsed lxml tree instead of the python-docx
+    paragraph/table object layer; w:p elements inside table cells are
+    visited too, in document order.
+    """
+    doc = Document(stream)
+    hyperlinks = []
+
+    paragraphs_text = []
+    for para in doc.element.body.iter(qn('w:p')):
+        text = "".join(t.text or "" for t in para.iter(qn('w:t')))
+        if text.strip():
+            paragraphs_text.append(text)
+        # Also check for hyperlink-styled runs in this paragraph
+        for run in para.iter(qn('w:r')):
+            # Read-only lookup: get_or_add_rPr would insert an empty rPr
+            # into every plain run, mutating the tree just to read a style
+            rPr = run.find(qn('w:rPr'))
+            if rPr is None:
+                continue
+            rStyle = rPr.find(qn('w:rStyle'))
+            if rStyle is not None and 'Hyperlink' in rStyle.get(qn('w:val')):
+                run_text = "".join(t.text or "" for t in run.iter(qn('w:t')))
+                hyperlinks.append((run_text, ""))  # URL will be extracted separately
+
+    # Extract hyperlinks from relationships
+    hyperlinks.extend(extract_hyperlinks_from_docx(doc))
+
+    return "\n".join(paragraphs_text), hyperlinks
+
+
+def _parse_plain_sync(stream) -> Tuple[str, List[Tuple[str, str]]]:
+    """Blocking fallback parse for plain text / unknown formats."""
+    text = stream.read().decode(errors="ignore")
+    return text, extract_urls_from_text(text)
+
+
 async def read_resume_text(file: UploadFile) -> Tuple[str, List[Tuple[str, str]]]:
     """
     Read and extract text from uploaded resume file (PDF, DOCX, or TXT).
     Also extracts hyperlinks when available.
-    
+
+    Parsing is CPU-bound, so it runs on the default thread pool via
+    asyncio.to_thread and the event loop keeps serving other requests.
+
     Args:
         file: Uploaded file from FastAPI form.
-    
+
     Returns:
         tuple: (extracted_text, list_of_hyperlinks)
             - extracted_text: str - Plain text content
             - list_of_hyperlinks: List[Tuple[str, str]] - List of (label, url) tuples
     """
-    content = await file.read()
     filename = file.filename.lower()
-    hyperlinks = []
-    text = ""
-    
+
+    # Parse straight from the upload's spooled temp file rather than
+    # materializing the whole payload in memory with file.read()
+    stream = file.file
+    stream.seek(0)
+
     if filename.endswith('.pdf'):
-        # PDF extraction with pdfplumber
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(content)
-            tmp.flush()
-            with pdfplumber.open(tmp.name) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += page_text + "\n"
-                    
-                    # Try to extract URLs from page
-                    urls_in_page = await extract_urls_from_text(page_text)
-                    hyperlinks.extend(urls_in_page)
-        
-        return text, hyperlinks
-    
+        return await asyncio.to_thread(_parse_pdf_sync, stream)
     elif filename.endswith('.docx'):
-        # DOCX extraction with python-docx
-        import io
-        doc = Document(io.BytesIO(content))
-        
-        # Extract text from paragraphs
-        paragraphs_text = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                paragraphs_text.append(paragraph.text)
-                # Also check for hyperlinks in this paragraph
-                for run in paragraph.runs:
-                    # Check if run has hyperlink
-                    rPr = run._element.get_or_add_rPr()
-                    rStyle = rPr.find(qn('w:rStyle'))
-                    if rStyle is not None and 'Hyperlink' in rStyle.get(qn('w:val')):
-                        hyperlinks.append((run.text, ""))  # URL will be extracted separately
-        
-        # Extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        paragraphs_text.append(cell.text)
-        
-        text = "\n".join(paragraphs_text)
-        
-        # Extract hyperlinks from relationships
-        docx_hyperlinks = await extract_hyperlinks_from_docx(doc)
-        hyperlinks.extend(docx_hyperlinks)
-        
-        return text, hyperlinks
-    
+        return await asyncio.to_thread(_parse_docx_sync, stream)
     else:
-        # Plain text or unknown format
-        text = content.decode(errors="ignore")
-        urls_in_text = await extract_urls_from_text(text)
-        hyperlinks.extend(urls_in_text)
-        return text, hyperlinks
+        return await asyncio.to_thread(_parse_plain_sync, stream)
@@ -1,28 +1,134 @@
 """Rule-based skill matching without heavy dependencies."""
-from typing import List
+import difflib
+import functools
+from typing import Iterable, List, Tuple
 from app.models.resume_schema import Resume, JobDescription, AnalysisResult
-from app.utils.scoring import compute_compatibility
+from app.services.extractor import TECH_WORDS, build_keyword_automaton, scan_keywords
 from app.utils.text_cleaner import normalize_text
 
-# Minimal vocabulary for Phase 1; extend later if needed
-DEFAULT_SKILL_VOCAB = [
+# Minimal vocabulary for Phase 1; extend later if needed.
+# A frozenset so membership checks stay O(1) as the vocabulary grows.
+DEFAULT_SKILL_VOCAB = frozenset({
     "python","fastapi","flask","django","nlp","spacy","nltk","bert","transformers",
     "pandas","numpy","sql","mongodb","postgres","aws","docker","kubernetes","spark",
-]
+})
+
+# Canonical names for skills that commonly appear under several spellings,
+# so "sklearn" on a resume still matches "scikit-learn" in a JD.
+SKILL_ALIASES = {
+    "sklearn": "scikit-learn",
+    "postgresql": "postgres",
+    "nextjs": "next.js",
+    "powerbi": "power bi",
+    "opencv-python": "opencv",
+    "torch": "pytorch",
+    "golang": "go",
+    "k8s": "kubernetes",
+}
+
+
+# Similarity threshold for the fuzzy matched-skill rescue pass
+_FUZZY_CUTOFF = 0.85
+
+
+def canonical_skill(skill: str) -> str:
+    """Map a skill to its canonical lowercase form."""
+    s = skill.lower()
+    return SKILL_ALIASES.get(s, s)
+
+
+# Fixed matching vocabulary: canonical forms of the extractor's TECH_WORDS
+# plus this module's vocab. Each skill owns one bit in a single Python int,
+# so overlap/missing become AND / AND-NOT plus a popcount.
+_VOCAB_WORDS = sorted(
+    {canonical_skill(w) for w in TECH_WORDS} | {canonical_skill(w) for w in DEFAULT_SKILL_VOCAB}
+)
+_VOCAB_INDEX = {w: i for i, w in enumerate(_VOCAB_WORDS)}
+
+
+def _skills_to_mask(skills: Iterable[str]) -> int:
+    """Pack canonical skill names into a vocabulary bitmask."""
+    mask = 0
+    for skill in skills:
+        i = _VOCAB_INDEX.get(skill)
+        if i is not None:
+            mask |= 1 << i
+    return mask
+
+
+def _mask_to_skills(mask: int) -> List[str]:
+    """Unpack a bitmask back to skill names (sorted, since the vocab is)."""
+    skills = []
+    i = 0
+    while mask:
+        if mask & 1:
+            skills.append(_VOCAB_WORDS[i])
+        mask >>= 1
+        i += 1
+    return skills
+
+
+# Automaton over the matcher's vocabulary, built once at import
+_SKILL_AUTOMATON = build_keyword_automaton(sorted(DEFAULT_SKILL_VOCAB))
 
 
 def extract_skills_from_text(text: str) -> List[str]:
-    t = normalize_text(text)
-    tokens = set(t.split())
-    return sorted([s for s in DEFAULT_SKILL_VOCAB if s in tokens])
+    return sorted(scan_keywords(_SKILL_AUTOMATON, normalize_text(text)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_skills_cached(text: str) -> Tuple[str, ...]:
+    """
+    Cached skill extraction for texts that recur across requests - above
+    all the JD, which is scanned once per resume in batch screening.
+    Returns a tuple so the result is hashable and safe to share.
+    """
+    return tuple(extract_skills_from_text(text))
+
+
+@functools.lru_cache(maxsize=512)
+def _score_pair(
+    resume_key: Tuple[str, ...], jd_key: Tuple[str, ...]
+) -> Tuple[float, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Score one (resume skills, JD skills) pair: (score, matched, missing).
+    Keys are sorted canonical tuples, so screening many resumes against
+    the same JD (or re-submitting the same resume) hits the cache instead
+    of redoing the mask math and fuzzy pass.
+    """
+    resume_mask = _skills_to_mask(resume_key)
+    jd_mask = _skills_to_mask(jd_key)
+    matched_mask = resume_mask & jd_mask
+    missing_mask = jd_mask & ~resume_mask
+
+    matched = _mask_to_skills(matched_mask)
+    missing = _mask_to_skills(missing_mask)
+
+    # Fuzzy rescue: JD skills with a near-identical resume spelling the alias
+    # table doesn't know yet (e.g. "postgress") still count as matched.
+    if missing and resume_key:
+        rescued = {
+            skill for skill in missing
+            if difflib.get_close_matches(skill, resume_key, n=1, cutoff=_FUZZY_CUTOFF)
+        }
+        if rescued:
+            matched = sorted(set(matched) | rescued)
+            missing = [s for s in missing if s not in rescued]
+
+    score = round(10.0 * len(matched) / max(1, jd_mask.bit_count()), 2)
+    return score, tuple(matched), tuple(missing)
 
 
 def analyze_resume_vs_jd(resume: Resume, jd: JobDescription) -> AnalysisResult:
-    jd_skills = extract_skills_from_text(jd.title + "\n" + jd.description)
+    jd_skills = [canonical_skill(s) for s in _extract_skills_cached(jd.title + "\n" + jd.description)]
+    resume_skills = [canonical_skill(s) for s in resume.skills]
 
-    score, matched, missing = compute_compatibility(resume.skills, jd_skills)
+    score, matched_t, missing_t = _score_pair(tuple(sorted(set(resume_skills))), tuple(sorted(set(jd_skills))))
+    matched = list(matched_t)
+    missing = list(missing_t)
 
-    irrelevant = [s for s in resume.skills if s not in jd_skills]
+    jd_set = set(jd_skills)
+    irrelevant = [s for s in resume.skills if canonical_skill(s) not in jd_set]
 
     suggestions = {
         "add": missing,
@@ -0,0 +1,15 @@
+"""Shared Jinja2 template setup for all routes."""
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+_BYTECODE_CACHE_DIR = ".jinja_cache"
+os.makedirs(_BYTECODE_CACHE_DIR, exist_ok=True)
+
+# One environment for the whole app: templates are compiled once per process
+# and the compiled bytecode is persisted across restarts.
+templates = Jinja2Templates(
+    directory="app/templates",
+    bytecode_cache=FileSystemBytecodeCache(_BYTECODE_CACHE_DIR),
+)
@@ -1,13 +1,70 @@
 """Text normalization helpers."""
 import re
+import string
+from typing import Dict, List
+
+# Patterns compiled once at import; every function below is on the
+# per-resume / per-JD hot path.
+_WS_RE = re.compile(r"\s+")
+_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9.,;:()\'"@ ]')
+
+# All contact-ish entities in one alternation; the linkedin branch comes
+# first so profile URLs are not swallowed by the generic url branch, and
+# non-capturing inner groups keep match.group(0) the full entity.
+_ENTITY_RE = re.compile(
+    r'(?P<linkedin>(?:https?://)?(?:www\.)?linkedin\.com/in/[a-zA-Z0-9-]+)'
+    r'|(?P<url>https?://\S+)'
+    r'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<phone>\+?\d[\d -]{8,}\d)'
+)
+
+
+def extract_entities(text: str) -> Dict[str, List[str]]:
+    """
+    Extract all contact entities in one scan of the text.
+
+    Args:
+        text (str): The text to search.
+
+    Returns:
+        Dict[str, List[str]]: Matches keyed by "url", "email", "phone"
+        and "linkedin", each in order of appearance.
+    """
+    entities: Dict[str, List[str]] = {"url": [], "email": [], "phone": [], "linkedin": []}
+    for match in _ENTITY_RE.finditer(text):
+        entities[match.lastgroup].append(match.group(0))
+    return entities
+
+
+# Characters normalize_text keeps; everything else becomes a space
+_NORMALIZE_KEEP = frozenset(string.ascii_lowercase + string.digits + "+#.")
+
+# A single token made only of kept characters is already normalized
+_NORMALIZED_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+class _SpaceFallback(dict):
+    """Translation table that maps every unlisted codepoint to a space."""
+
+    def __missing__(self, codepoint):
+        return 32
+
+
+_NORMALIZE_TRANS = _SpaceFallback(
+    {i: i if chr(i) in _NORMALIZE_KEEP else 32 for i in range(128)}
+)
+
 
 def normalize_text(text: str) -> str:
-    t = text.lower()
-    t = re.sub(r"[^a-z0-9+#.\s]", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
-from typing import List
-import re
+    # Fast path: individual skill tokens ("python", "c++", "c#") are the
+    # most frequent input and are already in normalized form.
+    if _NORMALIZED_TOKEN_RE.fullmatch(text):
+        return text
+    # One translate pass replaces disallowed chars, split/join collapses
+    # whitespace at C speed - same output as the old two regex subs with
+    # a single intermediate string instead of three.
+    return " ".join(text.lower().translate(_NORMALIZE_TRANS).split())
+
 
 def clean_text(text: str) -> str:
     """
@@ -20,11 +77,12 @@ def clean_text(text: str) -> str:
         str: The cleaned text.
     """
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     # Remove special characters (keeping alphanumeric and basic punctuation)
-    text = re.sub(r'[^a-zA-Z0-9.,;:()\'"@ ]', '', text)
+    text = _SPECIAL_CHARS_RE.sub('', text)
     return text
 
+
 def extract_email(text: str) -> List[str]:
     """
     Extracts email addresses from the input text.
@@ -35,8 +93,8 @@ def extract_email(text: str) -> List[str]:
     Returns:
         List[str]: A list of extracted email addresses.
     """
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    return re.findall(email_pattern, text)
+    return extract_entities(text)["email"]
+
 
 def extract_phone_numbers(text: str) -> List[str]:
     """
@@ -48,8 +106,8 @@ def extract_phone_numbers(text: str) -> List[str]:
     Returns:
         List[str]: A list of extracted phone numbers.
     """
-    phone_pattern = r'\+?\d[\d -]{8,}\d'
-    return re.findall(phone_pattern, text)
+    return extract_entities(text)["phone"]
+
 
 def extract_linkedin_profile(text: str) -> List[str]:
     """
@@ -61,5 +119,4 @@ def extract_linkedin_profile(text: str) -> List[str]:
     Returns:
         List[str]: A list of extracted LinkedIn profile URLs.
     """
-    linkedin_pattern = r'(https?://)?(www\.)?linkedin\.com/in/[a-zA-Z0-9-]+'
-    return re.findall(linkedin_pattern, text)
\ No newline at end of file
+    return extract_entities(text)["linkedin"]